@@ -0,0 +1,35 @@
+"""Add HNSW indexes on skill and role embeddings
+
+Revision ID: 0003_hnsw_embedding_indexes
+Revises: 0002_add_jd_table
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003_hnsw_embedding_indexes"
+down_revision: Union[str, None] = "0002_add_jd_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cosine-distance HNSW graphs (pgvector >= 0.5). Without them every
+    # `ORDER BY embedding <=> :vec LIMIT k` is a sequential scan over the table.
+    # Skill extraction only takes the pgvector path once the catalog exceeds
+    # SKILL_MATRIX_MAX_SKILLS; role normalisation always does.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_skills_embedding_hnsw "
+        "ON skills USING hnsw (embedding vector_cosine_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_role_categories_embedding_hnsw "
+        "ON role_categories USING hnsw (embedding vector_cosine_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_role_categories_embedding_hnsw")
+    op.execute("DROP INDEX IF EXISTS idx_skills_embedding_hnsw")
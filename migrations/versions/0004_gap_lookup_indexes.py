@@ -0,0 +1,36 @@
+"""Add indexes for gap-analysis profile reads and skill name lookups
+
+Revision ID: 0004_gap_lookup_indexes
+Revises: 0003_hnsw_embedding_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0004_gap_lookup_indexes"
+down_revision: Union[str, None] = "0003_hnsw_embedding_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # role_skill_profiles is the precomputed role → skill aggregate that gap
+    # analysis reads on every request. The (role_id, skill_id) PK already
+    # serves the role_id filter; this index only removes the sort for
+    # `ORDER BY importance_score DESC` — a small win on a few dozen rows.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_role_skill_profiles_role_importance "
+        "ON role_skill_profiles (role_id, importance_score DESC)"
+    )
+    # JD concept expansion resolves skill names case-insensitively.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_skills_display_name_lower "
+        "ON skills (lower(display_name))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_skills_display_name_lower")
+    op.execute("DROP INDEX IF EXISTS idx_role_skill_profiles_role_importance")
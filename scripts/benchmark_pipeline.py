@@ -7,8 +7,9 @@ Measures per-stage latency and compares against the 15-second E2E target.
 Stages measured (most require no DB or Groq key):
   parser     — PDF/DOCX text extraction + section detection
   alias      — alias map build (cold) vs cached + regex scan
-  embedding  — sentence-transformers batch inference over resume chunks
-  pgvector   — ANN vector search, per-chunk vs batched  (needs --with-db)
+  embedding  — sentence-transformers batch inference over sentence-packed chunks
+  pgvector   — skill search: in-process matrix (O9) vs pgvector batched/per-chunk
+               (needs --with-db; the matrix is loaded from pgvector)
   gap        — gap analysis role-profile query           (needs --with-db)
   llm        — Groq roadmap generation                  (needs --with-llm)
 
@@ -138,6 +139,16 @@ class PipelineBenchmark:
             ),
         }
 
+    def _get_production_chunks(self, model) -> list[str]:
+        """Chunk the test sections exactly as extract_skills() does (O11)."""
+        from src.services.skill_extractor import _CHUNK_MAX_TOKENS, _make_sentence_chunks
+
+        return [
+            chunk
+            for section_text in self._get_test_sections().values()
+            for chunk in _make_sentence_chunks(section_text, _CHUNK_MAX_TOKENS, model.tokenizer)
+        ]
+
     def _get_db(self):
         if self._db is None:
             from src.database import SessionLocal
@@ -207,9 +218,8 @@ class PipelineBenchmark:
 
     def bench_embedding(self) -> StageResult:
         try:
-            from sentence_transformers import SentenceTransformer
             from src.config import get_settings
-            from src.services.skill_extractor import _make_chunks
+            from src.services.embedding_model import get_embedding_model
         except ImportError as e:
             return StageResult(
                 name="embedding", target_ms=TARGETS_MS["embedding"],
@@ -217,9 +227,8 @@ class PipelineBenchmark:
             )
 
         settings = get_settings()
-        model = SentenceTransformer(settings.embedding_model)
-        text = " ".join(self._get_test_sections().values())
-        chunks = _make_chunks(text, chunk_size=80, overlap=20)
+        model = get_embedding_model()
+        chunks = self._get_production_chunks(model)
 
         # Warm-up pass (fills CPU caches, avoids cold-start in first timing)
         model.encode(chunks[:1], normalize_embeddings=True, show_progress_bar=False)
@@ -245,46 +254,53 @@ class PipelineBenchmark:
                 skipped=True, skip_reason="pass --with-db to enable (requires live DB)",
             )
         try:
-            from sentence_transformers import SentenceTransformer
-            from src.config import get_settings
+            from src.services.embedding_model import get_embedding_model
             from src.services.skill_extractor import (
-                _make_chunks,
+                _TOP_K,
+                _build_skill_matrix,
+                _matrix_search_batch,
                 _pgvector_search,
                 _pgvector_search_batch,
             )
-            import numpy as np
 
             db = self._get_db()
-            settings = get_settings()
-            model = SentenceTransformer(settings.embedding_model)
-            text = " ".join(self._get_test_sections().values())
-            chunks = _make_chunks(text, chunk_size=80, overlap=20)
+            model = get_embedding_model()
+            chunks = self._get_production_chunks(model)
             embeddings = model.encode(chunks, normalize_embeddings=True, show_progress_bar=False)
             emb_list = list(embeddings)
             db_runs = max(self.runs // 4, 5)
+            skill_ids, skill_matrix = _build_skill_matrix(db)  # primed once per worker
+
+            # ── Production: in-process matrix search (O9) ────────────────────
+            matrix = []
+            for _ in range(self.runs):
+                t0 = time.monotonic()
+                _matrix_search_batch(embeddings, skill_ids, skill_matrix, top_k=_TOP_K)
+                matrix.append((time.monotonic() - t0) * 1000)
 
             # ── A: per-chunk (N queries — before O2) ──────────────────────────
             per_chunk = []
             for _ in range(db_runs):
                 t0 = time.monotonic()
                 for emb in emb_list:
-                    _pgvector_search(emb, db, top_k=5)
+                    _pgvector_search(emb, db, top_k=_TOP_K)
                 per_chunk.append((time.monotonic() - t0) * 1000)
 
             # ── B: batched (1 query — O2) ─────────────────────────────────────
             batched = []
             for _ in range(db_runs):
                 t0 = time.monotonic()
-                _pgvector_search_batch(emb_list, db, top_k=5)
+                _pgvector_search_batch(emb_list, db, top_k=_TOP_K)
                 batched.append((time.monotonic() - t0) * 1000)
 
             result = StageResult(name="pgvector", target_ms=TARGETS_MS["pgvector"])
-            result.runs = batched  # target measured against O2 (batched)
+            result.runs = matrix  # target measured against the production path (O9)
             result.notes = [
-                f"Chunk count: {len(chunks)}",
+                f"Chunk count: {len(chunks)}  |  skills in matrix: {len(skill_ids)}",
                 f"Per-chunk p95: {_p95(per_chunk):.0f} ms  ({len(chunks)} queries — before O2)",
-                f"Batched p95: {_p95(batched):.0f} ms  (1 query — after O2)",
-                f"Speedup: {_p95(per_chunk) / max(_p95(batched), 0.1):.1f}×",
+                f"Batched p95: {_p95(batched):.0f} ms  (1 query — O2, large catalogs only)",
+                f"Matrix p95: {_p95(matrix):.1f} ms  (in-process GEMM — O9, production)",
+                f"Speedup vs batched: {_p95(batched) / max(_p95(matrix), 0.1):.1f}×",
             ]
             return result
 
@@ -470,6 +486,8 @@ def render_markdown(results: list[StageResult]) -> str:
         "| O6 | analyze_resume.py + roadmap_generator.py | DB transaction split; LLM runs outside open context | −5–15 s conn hold |",
         "| O7 | (SQL — not yet applied) | CREATE INDEX on roadmaps((content->>_cache_key)) | cache lookup −95% |",
         "| O8 | worker.py | Embedding model pre-warmed at worker_ready signal | cold-start −2–10 s |",
+        "| O9 | skill_extractor.py | Skill embeddings cached as one matrix; all chunks scored in-process | skill search −DB round-trip |",
+        "| O11 | skill_extractor.py | Sentence-packed ≤100-token chunks replace 80-word overlapping windows | fewer/shorter chunks |",
         "",
         "## Pending Recommendations",
         "",
@@ -11,7 +11,8 @@ Usage:
         [--class single_column] \\
         [--format markdown|json] \\
         [--output eval_report.md] \\
-        [--verbose]
+        [--verbose] \\
+        [--workers 4]
 
 No database or running server required.
 Skill matching uses data/skills_master.csv for alias lookup (text-mode).
@@ -24,6 +25,7 @@ import re
 import sys
 import time
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -629,6 +631,15 @@ def render_json(metrics: list[MetricSet], agg: dict) -> str:
 
 # ─────────────────── CLI ──────────────────────────────────────────────────────
 
+def _print_attempt(attempt: ParseAttempt) -> None:
+    rec = attempt.record
+    status = "OK" if attempt.success else f"FAILED ({attempt.error_type})"
+    print(
+        f"  {rec.gt.resume_class}/{rec.path.name} ... {status} [{attempt.latency_ms:.0f}ms]",
+        file=sys.stderr,
+    )
+
+
 def main():
     ap = argparse.ArgumentParser(
         description="Evaluate the resume parser against a labelled fixture corpus."
@@ -646,6 +657,8 @@ def main():
                     help="Write report to this file instead of stdout")
     ap.add_argument("--verbose", action="store_true",
                     help="Include per-resume detail section in report")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="Parse resumes in this many processes (PDF parsing is CPU-bound)")
     args = ap.parse_args()
 
     print("Loading skill alias map...", file=sys.stderr)
@@ -665,13 +678,17 @@ def main():
 
     print("Parsing...", file=sys.stderr)
     attempts = []
-    for rec in records:
-        label = f"  {rec.gt.resume_class}/{rec.path.name}"
-        print(label, file=sys.stderr, end=" ... ")
-        attempt = run_parse(rec)
-        status = "OK" if attempt.success else f"FAILED ({attempt.error_type})"
-        print(f"{status} [{attempt.latency_ms:.0f}ms]", file=sys.stderr)
-        attempts.append(attempt)
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = pool.map(run_parse, records, chunksize=4)
+            for attempt in results:
+                _print_attempt(attempt)
+                attempts.append(attempt)
+    else:
+        for rec in records:
+            attempt = run_parse(rec)
+            _print_attempt(attempt)
+            attempts.append(attempt)
 
     print("Computing metrics...", file=sys.stderr)
     all_metrics = [evaluate_one(a, alias_map) for a in attempts]
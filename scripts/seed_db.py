@@ -23,7 +23,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import structlog
-from sqlalchemy import text
+from sqlalchemy import insert, text
 
 from src.config import get_settings
 from src.database import Base, SessionLocal, engine
@@ -142,10 +142,10 @@ def _seed_skill_categories(db) -> dict[str, int]:
 
 def _seed_skills(db, category_map: dict[str, int]) -> dict[str, int]:
     """Seed skills from CSV with embeddings. Returns {canonical_name: skill_id}."""
-    from sentence_transformers import SentenceTransformer
     from src.models.skill import Skill
+    from src.services.embedding_model import get_embedding_model
 
-    model = SentenceTransformer(settings.embedding_model)
+    model = get_embedding_model()
 
     skill_map: dict[str, int] = {}
     existing = {s.canonical_name: s.skill_id for s in db.query(Skill).all()}
@@ -156,48 +156,59 @@ def _seed_skills(db, category_map: dict[str, int]) -> dict[str, int]:
         for row in reader:
             rows.append(row)
 
+    # Only rows not yet in the DB need an embedding — a plain re-seed encodes
+    # nothing. One batched encode() for the rest: sentence-transformers sorts
+    # inputs by length internally, so each mini-batch pads to a similar size.
+    new_rows = []
+    for row in rows:
+        canonical = row["canonical_name"].strip()
+        if canonical in existing:
+            skill_map[canonical] = existing[canonical]
+        else:
+            new_rows.append(row)
+
     # Batch embed all display names + aliases for better representation
     texts_to_embed = [
         f"{r['display_name']} {r['category']} {r['aliases'].replace('|', ' ')}"
-        for r in rows
+        for r in new_rows
     ]
     log.info("embedding_skills", count=len(texts_to_embed))
-    embeddings = model.encode(texts_to_embed, normalize_embeddings=True, show_progress_bar=True, batch_size=64)
-
-    new_count = 0
-    for i, row in enumerate(rows):
-        canonical = row["canonical_name"].strip()
-        if canonical in existing:
-            skill_map[canonical] = existing[canonical]
-            continue
-
+    embeddings = (
+        model.encode(texts_to_embed, normalize_embeddings=True, show_progress_bar=True, batch_size=64)
+        if texts_to_embed
+        else []
+    )
+
+    # Create missing categories up front so seed never crashes
+    for row in new_rows:
         cat_key = row["category"].strip()
-        category_id = category_map.get(cat_key)
-        if category_id is None:
-            # Create missing category on the fly so seed never crashes
+        if cat_key not in category_map:
             from src.models.skill import SkillCategory
             new_cat = SkillCategory(name=cat_key.replace("_", " ").title())
             db.add(new_cat)
             db.flush()
             category_map[cat_key] = new_cat.category_id
-            category_id = new_cat.category_id
-        aliases = [a.strip() for a in row["aliases"].split("|") if a.strip()]
-        embedding_list = embeddings[i].tolist()
-
-        skill = Skill(
-            canonical_name=canonical,
-            display_name=row["display_name"].strip(),
-            category_id=category_id,
-            aliases=aliases,
-            embedding=embedding_list,
-            is_active=True,
-        )
-        db.add(skill)
-        db.flush()
-        skill_map[canonical] = skill.skill_id
-        new_count += 1
 
-    log.info("skills_seeded", new=new_count, total=len(skill_map))
+    # One multi-row INSERT … RETURNING for all new skills; generated ids are
+    # mapped back through the canonical_name natural key.
+    records = [
+        {
+            "canonical_name": row["canonical_name"].strip(),
+            "display_name": row["display_name"].strip(),
+            "category_id": category_map[row["category"].strip()],
+            "aliases": [a.strip() for a in row["aliases"].split("|") if a.strip()],
+            "embedding": embedding,  # ndarray → pgvector Vector, no per-float boxing
+            "is_active": True,
+        }
+        for row, embedding in zip(new_rows, embeddings)
+    ]
+    if records:
+        inserted = db.execute(
+            insert(Skill).returning(Skill.canonical_name, Skill.skill_id), records
+        ).all()
+        skill_map.update({canonical: skill_id for canonical, skill_id in inserted})
+
+    log.info("skills_seeded", new=len(records), total=len(skill_map))
     return skill_map
 
 
@@ -207,12 +218,12 @@ def _seed_skills(db, category_map: dict[str, int]) -> dict[str, int]:
 
 def _seed_roles(db) -> dict[str, int]:
     """Seed role categories with embeddings. Returns {canonical_name: role_id}."""
-    from sentence_transformers import SentenceTransformer
     from src.models.role import RoleCategory
+    from src.services.embedding_model import get_embedding_model
 
-    model = SentenceTransformer(settings.embedding_model)
+    model = get_embedding_model()
     role_map: dict[str, int] = {}
-    existing = {r.canonical_name: r.role_id for r in db.query(RoleCategory).all()}
+    existing = {r.canonical_name: r for r in db.query(RoleCategory).all()}
 
     rows = []
     with open(ROLES_CSV, encoding="utf-8") as f:
@@ -220,43 +231,52 @@ def _seed_roles(db) -> dict[str, int]:
         for row in reader:
             rows.append(row)
 
-    texts = [
-        f"{r['display_name']} {r['domain']} {r['aliases'].replace('|', ' ')}"
-        for r in rows
-    ]
-    embeddings = model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
-
     updated_count = 0
-    new_count = 0
-    for i, row in enumerate(rows):
+    new_rows = []
+    for row in rows:
         canonical = row["canonical_name"].strip()
-        aliases = [a.strip() for a in row["aliases"].split("|") if a.strip()]
-        if canonical in existing:
-            role_map[canonical] = existing[canonical]
-            # Sync aliases from CSV without regenerating embeddings.
-            # Allows roles.csv updates (new aliases, display_name tweaks) to
-            # propagate on a normal re-seed without --reset.
-            role_obj = db.query(RoleCategory).filter(
-                RoleCategory.canonical_name == canonical
-            ).first()
-            if role_obj and set(role_obj.aliases or []) != set(aliases):
-                role_obj.aliases = aliases
-                updated_count += 1
+        if canonical not in existing:
+            new_rows.append(row)
             continue
+        role_obj = existing[canonical]
+        role_map[canonical] = role_obj.role_id
+        # Sync aliases from CSV without regenerating embeddings.
+        # Allows roles.csv updates (new aliases, display_name tweaks) to
+        # propagate on a normal re-seed without --reset.
+        aliases = [a.strip() for a in row["aliases"].split("|") if a.strip()]
+        if set(role_obj.aliases or []) != set(aliases):
+            role_obj.aliases = aliases
+            updated_count += 1
 
-        role = RoleCategory(
-            canonical_name=canonical,
-            display_name=row["display_name"].strip(),
-            domain=row["domain"].strip(),
-            aliases=aliases,
-            embedding=embeddings[i].tolist(),
-        )
-        db.add(role)
-        db.flush()
-        role_map[canonical] = role.role_id
-        new_count += 1
-
-    log.info("roles_seeded", new=new_count, aliases_updated=updated_count, total=len(role_map))
+    # Embed only roles that don't exist yet, in one batched encode() call.
+    texts = [
+        f"{r['display_name']} {r['domain']} {r['aliases'].replace('|', ' ')}"
+        for r in new_rows
+    ]
+    embeddings = (
+        model.encode(texts, normalize_embeddings=True, show_progress_bar=False, batch_size=64)
+        if texts
+        else []
+    )
+
+    records = [
+        {
+            "canonical_name": row["canonical_name"].strip(),
+            "display_name": row["display_name"].strip(),
+            "domain": row["domain"].strip(),
+            "aliases": [a.strip() for a in row["aliases"].split("|") if a.strip()],
+            "embedding": embedding,
+        }
+        for row, embedding in zip(new_rows, embeddings)
+    ]
+    if records:
+        inserted = db.execute(
+            insert(RoleCategory).returning(RoleCategory.canonical_name, RoleCategory.role_id),
+            records,
+        ).all()
+        role_map.update({canonical: role_id for canonical, role_id in inserted})
+
+    log.info("roles_seeded", new=len(records), aliases_updated=updated_count, total=len(role_map))
     return role_map
 
 
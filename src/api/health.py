@@ -21,7 +21,7 @@ settings = get_settings()
 
 
 @router.get("/health")
-async def health_check():
+def health_check():
     db_status = "ok"
     redis_status = "ok"
 
@@ -7,6 +7,8 @@ POST /v1/jd/analyze
   - Creates UserSession + Task + Resume + JDAnalysis records
   - Enqueues analyze_jd_task (Celery)
   - Returns 202 with session_id — same polling/results flow as standard analysis
+  - Plain `def`, like the resume upload: blocking DB + broker calls run in the
+    threadpool
 """
 
 import datetime
@@ -59,7 +61,7 @@ def _enforce_rate_limit(request: Request) -> None:
 
 
 @router.post("/analyze", status_code=status.HTTP_202_ACCEPTED)
-async def analyze_jd(
+def analyze_jd(
     request: Request,
     file: Annotated[UploadFile, File(description="PDF or DOCX resume")],
     jd_text: Annotated[str, Form(description="Raw job description text")],
@@ -75,8 +77,8 @@ async def analyze_jd(
     if suffix not in _ALLOWED_EXTENSIONS:
         raise HTTPException(status_code=422, detail="Unsupported file type. Upload a PDF or DOCX file.")
 
-    file_bytes = await file.read()
     max_bytes = settings.max_upload_size_mb * 1024 * 1024
+    file_bytes = file.file.read(max_bytes + 1)  # bounded read — see resume.py
     if len(file_bytes) > max_bytes:
         raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {settings.max_upload_size_mb} MB.")
     if len(file_bytes) < 100:
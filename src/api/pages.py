@@ -187,7 +187,7 @@ async def landing_page(request: Request):
 
 
 @router.get("/processing/{session_id}", response_class=HTMLResponse)
-async def processing_page(
+def processing_page(
     request: Request,
     session_id: str,
     db: Session = Depends(get_db),
@@ -207,7 +207,7 @@ async def processing_page(
 
 
 @router.get("/results/{session_id}", response_class=HTMLResponse)
-async def results_page(
+def results_page(
     request: Request,
     session_id: str,
     db: Session = Depends(get_db),
@@ -231,7 +231,7 @@ async def results_page(
 
 
 @router.get("/v1/results/{session_id}")
-async def results_api(session_id: str, db: Session = Depends(get_db)):
+def results_api(session_id: str, db: Session = Depends(get_db)):
     try:
         _build_results_context(session_id, db)
     except HTTPException as exc:
@@ -8,6 +8,8 @@ POST /v1/resume/upload
   - Creates UserSession + Task records
   - Enqueues analyze_resume_task (Celery)
   - Returns 202 with session_id for polling
+  - Plain `def`: the DB flush/commit and the broker publish are blocking, so
+    FastAPI runs the handler in its threadpool instead of on the event loop.
 """
 
 import datetime
@@ -60,7 +62,7 @@ def _enforce_upload_rate_limit(request: Request) -> None:
 
 
 @router.post("/upload", status_code=status.HTTP_202_ACCEPTED)
-async def upload_resume(
+def upload_resume(
     request: Request,
     file: Annotated[UploadFile, File(description="PDF or DOCX resume")],
     target_role: Annotated[str, Form(description="Target job role, e.g. 'Backend Software Engineer'")],
@@ -79,8 +81,10 @@ async def upload_resume(
         )
 
     # --- Validate file size ---
-    file_bytes = await file.read()
+    # Read at most one byte past the limit: an oversized upload is rejected
+    # without copying the whole spooled file into memory first.
     max_bytes = settings.max_upload_size_mb * 1024 * 1024
+    file_bytes = file.file.read(max_bytes + 1)
     if len(file_bytes) > max_bytes:
         raise HTTPException(
             status_code=413,
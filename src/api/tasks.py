@@ -4,6 +4,8 @@ Task status polling endpoint.
 GET /v1/tasks/{session_id}
   - Returns current task status, progress, and result when complete.
   - Frontend polls this every 2s while on the /processing page.
+  - Plain `def`: the SQLAlchemy session is synchronous, so FastAPI runs the
+    handler in its threadpool instead of blocking the event loop on each poll.
 """
 
 import uuid
@@ -20,7 +22,7 @@ router = APIRouter(prefix="/v1/tasks", tags=["tasks"])
 
 
 @router.get("/{session_id}")
-async def get_task_status(session_id: str, db: Session = Depends(get_db)):
+def get_task_status(session_id: str, db: Session = Depends(get_db)):
     try:
         sid = uuid.UUID(session_id)
     except ValueError:
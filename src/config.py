@@ -5,6 +5,8 @@ No other file calls os.getenv() directly.
 """
 
 from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -28,18 +30,27 @@ class Settings(BaseSettings):
 
     # ── Redis ──────────────────────────────────────────────────────────────────
     redis_url: str = "redis://localhost:6379"
+    resume_cache_ttl_seconds: int = 900  # parse + skill results by file hash; 0 = off
 
     # ── AI: LLM ───────────────────────────────────────────────────────────────
     groq_api_key: str = ""
     llm_model: str = "llama-3.3-70b-versatile"
+    llm_timeout_seconds: float = 60.0  # Groq read timeout per HTTP attempt
 
     # ── AI: Embeddings ────────────────────────────────────────────────────────
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     embedding_dimension: int = 384
+    embedding_device: Literal["auto", "cpu", "cuda", "mps"] = "auto"
+    embedding_num_threads: int = 0      # CPU intra-op threads; 0 = min(8, cpu_count)
+    embedding_backend: Literal["torch", "onnx", "openvino"] = "torch"  # onnx/openvino need the [onnx] extra
+    embedding_model_file: str = ""      # e.g. onnx/model_O3.onnx, onnx/model_qint8_avx2.onnx
+    preload_embedding_model: bool = True  # CPU only: load in the Celery parent before fork
 
     # ── Skill Extraction ──────────────────────────────────────────────────────
     skill_extraction_threshold: float = 0.38
     skill_extraction_top_k: int = 30
+    skill_matrix_precision: Literal["float32", "float16", "int8"] = "float32"  # float16 2×, int8 4× smaller
+    skill_matrix_max_skills: int = 100_000   # larger catalogs use pgvector HNSW instead
 
     # ── File Upload ───────────────────────────────────────────────────────────
     max_upload_size_mb: int = 5
@@ -0,0 +1,145 @@
+"""
+Shared sentence-transformers loader.
+
+One model instance per process, used by skill_extractor, role_normalizer and
+scripts/seed_db.py. Device placement and CPU thread limits are decided here,
+once, at load time:
+
+  EMBEDDING_DEVICE=auto       → "cuda" when torch sees a GPU, else "cpu"
+  EMBEDDING_NUM_THREADS=0     → min(8, cpu_count) intra-op threads on CPU,
+                                for torch, ONNX Runtime and OpenVINO alike
+  EMBEDDING_BACKEND=torch     → "onnx" / "openvino" run the same model through
+                                ONNX Runtime / OpenVINO (pip install .[onnx])
+  EMBEDDING_MODEL_FILE=       → onnx/openvino only: pick a pre-exported graph from the hub repo,
+                                e.g. onnx/model_O3.onnx (graph-optimised) or
+                                onnx/model_qint8_avx2.onnx (dynamic int8)
+
+MiniLM-sized models stop scaling past 4–8 intra-op threads, and torch's
+default (one per core) oversubscribes hosts that run several workers.
+ONNX Runtime is typically 2–3× faster than eager torch on CPU; the
+sentence-transformers wrapper keeps pooling + normalisation identical, so
+stored embeddings stay comparable. A missing backend falls back to torch.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+from functools import lru_cache
+from typing import Optional
+
+import structlog
+
+from src.config import get_settings
+
+log = structlog.get_logger(__name__)
+settings = get_settings()
+
+_MAX_AUTO_THREADS = 8
+
+
+@lru_cache(maxsize=1)
+def get_embedding_model():
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    device = _resolve_device(torch)
+    if device == "cpu":
+        _configure_cpu_threads(torch)
+
+    backend = settings.embedding_backend
+    try:
+        model = SentenceTransformer(
+            settings.embedding_model,
+            device=device,
+            backend=backend,
+            model_kwargs=_backend_model_kwargs(backend, device),
+        )
+    except Exception as exc:
+        # sentence-transformers raises a bare Exception when optimum/onnxruntime
+        # are missing (ImportError when building ORT session options); a bad
+        # EMBEDDING_MODEL_FILE surfaces the same way.
+        if backend == "torch":
+            raise
+        log.warning("embedding_backend_unavailable", backend=backend, error=str(exc))
+        backend = "torch"
+        model = SentenceTransformer(settings.embedding_model, device=device)
+
+    log.info(
+        "embedding_model_loaded",
+        model=settings.embedding_model,
+        backend=backend,
+        device=device,
+        torch_threads=torch.get_num_threads(),
+    )
+    return model
+
+
+def fork_safe_device() -> Optional[str]:
+    """
+    The device get_embedding_model() will use, if it can be decided without
+    initialising the CUDA driver; None otherwise.
+
+    torch.cuda.is_available() calls cuInit, after which forked children can no
+    longer use CUDA — so "auto" only resolves here when torch has no CUDA build
+    or the host has no NVIDIA driver (the default PyPI torch wheel is
+    CUDA-built, so most CPU hosts land in the second case).
+    """
+    device = settings.embedding_device
+    if device != "auto":
+        return device
+    import torch
+
+    if not torch.backends.cuda.is_built():
+        return "cpu"
+    try:
+        # Loading the driver library does not initialise CUDA.
+        ctypes.CDLL("libnvidia-ml.so.1")
+    except OSError:
+        return "cpu"
+    return None
+
+
+def _resolve_device(torch) -> str:
+    device = settings.embedding_device
+    if device != "auto":
+        return device
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _backend_model_kwargs(backend: str, device: str) -> Optional[dict]:
+    """
+    model_kwargs for the ONNX / OpenVINO loaders; None for torch, whose model
+    constructor rejects file_name. torch.set_num_threads() does not reach these
+    runtimes, so the CPU thread limit is passed to their sessions here.
+    """
+    if backend == "torch":
+        return None
+    kwargs: dict = {}
+    if settings.embedding_model_file:
+        kwargs["file_name"] = settings.embedding_model_file
+    if device == "cpu":
+        threads = _cpu_threads()
+        if backend == "onnx":
+            import onnxruntime as ort
+
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+            kwargs["session_options"] = options
+        elif backend == "openvino":
+            kwargs["ov_config"] = {"INFERENCE_NUM_THREADS": str(threads)}
+    return kwargs
+
+
+def _cpu_threads() -> int:
+    return settings.embedding_num_threads or min(_MAX_AUTO_THREADS, os.cpu_count() or 1)
+
+
+def _configure_cpu_threads(torch) -> None:
+    torch.set_num_threads(_cpu_threads())
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set before torch starts its inter-op pool; keep the default.
+        pass
@@ -0,0 +1,114 @@
+"""
+Content-addressed cache for resume parsing + skill extraction.
+
+Identical uploads (same bytes) are common — users re-run analysis against a
+different target role or duration. Steps 2 and 4 of the analysis pipeline
+depend only on the file bytes, the embedding config and the skill catalog,
+so their output is stored in Redis under the file's SHA-256 and reused on
+the next upload.
+
+Privacy: the payload contains parsed resume text, so the TTL defaults to the
+same 15 minutes after which the wipe task removes it from Postgres
+(RESUME_CACHE_TTL_SECONDS=0 disables the cache).
+
+Staleness: the key carries every setting that changes extraction scores
+(model, backend, model file, matrix precision, threshold) plus a catalog
+fingerprint (active skill count + max skill_id) read at lookup time, so a
+config change or a re-seeded catalog never serves stale or dangling skill ids.
+
+Redis failures are never fatal — every function degrades to a cache miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Optional
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+
+log = structlog.get_logger(__name__)
+settings = get_settings()
+
+_KEY_PREFIX = "resume_cache:v2"
+
+
+def analysis_cache_key(file_bytes: bytes, db: Session) -> Optional[str]:
+    """Cache key for this upload, or None when the cache is disabled/unreachable."""
+    if _get_redis() is None:
+        return None
+    row = db.execute(
+        text(
+            "SELECT count(*) AS n, coalesce(max(skill_id), 0) AS max_id "
+            "FROM skills WHERE is_active = true"
+        )
+    ).one()
+    return _cache_key(content_digest(file_bytes), f"{row.n}.{row.max_id}")
+
+
+def content_digest(file_bytes: bytes) -> str:
+    # hashlib delegates to OpenSSL, which uses SHA-NI where the CPU has it.
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def get_cached_analysis(key: Optional[str]) -> Optional[dict[str, Any]]:
+    """Return {"parsed": ..., "skills": [...]} for a previous upload, or None."""
+    client = _get_redis()
+    if client is None or key is None:
+        return None
+    try:
+        raw = client.get(key)
+        return None if raw is None else json.loads(raw)
+    except Exception as exc:
+        # Unreachable Redis or a corrupt entry — either way a miss.
+        log.warning("resume_cache_get_failed", error=str(exc))
+        return None
+
+
+def set_cached_analysis(key: Optional[str], parsed: dict, skills: list[dict]) -> None:
+    client = _get_redis()
+    if client is None or key is None:
+        return
+    payload = json.dumps({"parsed": parsed, "skills": skills})
+    try:
+        client.setex(key, settings.resume_cache_ttl_seconds, payload)
+    except Exception as exc:
+        log.warning("resume_cache_set_failed", error=str(exc))
+
+
+def _cache_key(digest: str, catalog_fingerprint: str) -> str:
+    config = ":".join(
+        str(v)
+        for v in (
+            settings.embedding_model,
+            settings.embedding_backend,
+            settings.embedding_model_file,
+            settings.skill_matrix_precision,
+            settings.skill_extraction_threshold,
+        )
+    )
+    return f"{_KEY_PREFIX}:{config}:{catalog_fingerprint}:{digest}"
+
+
+@lru_cache(maxsize=1)
+def _get_redis():
+    if settings.resume_cache_ttl_seconds <= 0:
+        return None
+    try:
+        import ssl as _ssl
+
+        import redis as _redis
+
+        url = settings.redis_url.split("?")[0]
+        kwargs: dict[str, Any] = dict(socket_connect_timeout=2, socket_timeout=2)
+        if url.startswith("rediss://"):
+            kwargs["ssl_cert_reqs"] = _ssl.CERT_NONE
+        return _redis.from_url(url, **kwargs)
+    except Exception as exc:
+        log.warning("resume_cache_unavailable", error=str(exc))
+        return None
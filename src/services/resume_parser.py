@@ -90,12 +90,10 @@ def _extract_pdf(file_bytes: bytes) -> str:
     try:
         import fitz  # PyMuPDF
 
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-        pages = []
-        for page in doc:
-            pages.append(page.get_text("text"))
-        doc.close()
-        return "\n".join(pages)
+        # Context manager closes the document on error paths too; the page
+        # strings are consumed straight into join() without a staging list.
+        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+            return "\n".join(page.get_text("text") for page in doc)
     except ImportError:
         raise ParseError("PDF parsing library (PyMuPDF) not installed.")
     except Exception as exc:
@@ -15,12 +15,16 @@ Performance optimisations (O3 + O6):
   O6 — generate_roadmap() no longer accepts a db Session. It manages its own
        short-lived connections so the Celery task does not hold an open
        transaction during the 4–15 s LLM call.
+  O15 — One Groq client per worker process (lru_cache). The SDK client owns an
+        httpx connection pool, so reusing it keeps the TLS connection to the
+        API warm instead of re-handshaking on every roadmap.
 """
 
 from __future__ import annotations
 
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -38,6 +42,12 @@ settings = get_settings()
 _PROMPT_DIR = Path(__file__).parent.parent.parent / "prompts"
 _PROMPT_CACHE: dict[str, str] = {}  # version → template string
 
+_SYSTEM_MSG = (
+    "You are a senior career coach and technical curriculum designer. "
+    "Always respond ONLY with valid JSON matching the exact schema provided. "
+    "No markdown fences, no commentary — raw JSON only."
+)
+
 
 # ---------------------------------------------------------------------------
 # Pydantic schema for LLM output validation
@@ -163,25 +173,31 @@ def generate_roadmap(
 # LLM call (O3: max_tokens 4096 → 2000)
 # ---------------------------------------------------------------------------
 
-def _call_llm_with_retry(prompt: str) -> tuple[Optional[dict], str]:
-    """Returns (parsed_content_dict | None, model_name_str)."""
+@lru_cache(maxsize=1)
+def _get_groq_client():
+    """O15: process-wide client, built on first LLM call."""
+    import httpx
     from groq import Groq
 
-    client = Groq(api_key=settings.groq_api_key)
-    model = settings.llm_model
-
-    system_msg = (
-        "You are a senior career coach and technical curriculum designer. "
-        "Always respond ONLY with valid JSON matching the exact schema provided. "
-        "No markdown fences, no commentary — raw JSON only."
+    # The SDK keeps its default retries (2, with backoff) for rate limits,
+    # 5xx and connection errors; the loop below only retries bad JSON. Only the
+    # read/write budget is configurable — connects still fail fast after 5 s.
+    return Groq(
+        api_key=settings.groq_api_key,
+        timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=5.0),
     )
 
+
+def _call_llm_with_retry(prompt: str) -> tuple[Optional[dict], str]:
+    """Returns (parsed_content_dict | None, model_name_str)."""
+    model = settings.llm_model
+
     for attempt in range(2):
         try:
-            response = client.chat.completions.create(
+            response = _get_groq_client().chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": system_msg},
+                    {"role": "system", "content": _SYSTEM_MSG},
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.4,
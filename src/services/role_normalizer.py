@@ -21,7 +21,6 @@ from __future__ import annotations
 
 import difflib
 from dataclasses import dataclass
-from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -31,6 +30,7 @@ from sqlalchemy.orm import Session
 
 from src.config import get_settings
 from src.models.role import RoleCategory
+from src.services.embedding_model import get_embedding_model
 
 log = structlog.get_logger(__name__)
 settings = get_settings()
@@ -52,10 +52,8 @@ class RoleMatch:
     suggestions: list[dict]  # populated when match_type in ("semantic_suggest", "no_match")
 
 
-@lru_cache(maxsize=1)
 def _get_embedding_model():
-    from sentence_transformers import SentenceTransformer
-    return SentenceTransformer(settings.embedding_model)
+    return get_embedding_model()
 
 
 def normalize_role(role_text: str, db: Session) -> RoleMatch:
@@ -4,8 +4,9 @@ Two-pass skill extraction pipeline.
 Pass 1 — Alias pre-scan (exact/fuzzy string match against all known aliases).
           Fast, deterministic, confidence = 0.95.
 
-Pass 2 — Embedding ANN search via pgvector on 80-word overlapping text chunks.
-          Catches paraphrased / informal skill mentions.
+Pass 2 — Embedding similarity search on sentence-packed text chunks (≤100
+          tokens) against the process-cached skill matrix. Catches
+          paraphrased / informal skill mentions.
 
 Score fusion:
   - Section weight multiplies the raw similarity score.
@@ -18,13 +19,37 @@ Performance optimisations applied:
        from DB on first call, reused for all subsequent tasks in the same worker).
   O2 — pgvector ANN queries batched: all chunk embeddings sent in a single
        SQL round-trip via json_to_recordset + LATERAL, instead of one query
-       per chunk.
+       per chunk. The hot path uses O9; O2 serves oversized catalogs (O14)
+       and the benchmarks.
+  O9 — Skill embeddings cached at process level as one L2-normalised
+       (n_skills, d) float32 matrix. Pass 2 scores every chunk against every
+       skill with sentence_transformers.util.semantic_search (dot score on
+       unit vectors == cosine): a tiled CPU torch GEMM + torch.topk over
+       zero-copy views of the numpy arrays — no per-request DB round-trip,
+       no per-skill Python loop.
+  O11 — Chunks are built from whole sentences/lines packed up to 100 model
+        tokens instead of fixed 80-word windows with 20-word overlap. No
+        duplicated overlap text is encoded, and short resume sections stay
+        short, so per-batch padding (sentence-transformers pads each
+        length-sorted mini-batch to its longest member) stays small.
+  O12 — SKILL_MATRIX_PRECISION=int8 keeps the cached skill matrix as int8 with
+        a per-row scale (4× less resident memory per worker). Chunks are
+        quantised the same way per request and scored with torch._int_mm, an
+        int8 GEMM with int32 accumulation, so the matrix is never widened and
+        only the (n_chunks, n_skills) score array is allocated. Off by
+        default: scores carry ~1% error, well inside the 0.38 threshold.
+        SKILL_MATRIX_PRECISION=float16 halves resident memory instead, with
+        ~1e-4 score error. Scored by a torch fp16 GEMM on the cached matrix;
+        only the (n_chunks, n_skills) score array is float32.
+  O14 — Catalogs larger than SKILL_MATRIX_MAX_SKILLS are not loaded into
+        memory; pass 2 falls back to the O2 batched pgvector query, served by
+        the HNSW index from migration 0003 (log-time graph walk per chunk
+        instead of a full scan).
 """
 
 import json as _json
 import re
 import threading
-from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -34,14 +59,18 @@ from sqlalchemy.orm import Session
 
 from src.config import get_settings
 from src.models.skill import Skill
+from src.services.embedding_model import get_embedding_model
 from src.services.resume_parser import get_section_weight
 
 log = structlog.get_logger(__name__)
 settings = get_settings()
 
-_CHUNK_SIZE = 80      # words per chunk
-_CHUNK_OVERLAP = 20   # word overlap between chunks
-_TOP_K = 5            # ANN candidates per chunk
+_CHUNK_MAX_TOKENS = 100  # model tokens per sentence-packed chunk
+_TOP_K = 5               # ANN candidates per chunk
+# Skill rows widened at a time when torch has no CPU int8/fp16 GEMM (O12)
+_SCORE_BLOCK_ROWS = 4096
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?\n])\s+")
 
 # ── O1: Process-level alias/pattern caches ────────────────────────────────────
 # Populated lazily on the first extract_skills() call; thread-safe via a lock.
@@ -51,11 +80,16 @@ _sorted_aliases_cache: Optional[list[str]] = None      # sorted longest-first
 _pattern_cache: Optional[dict[str, re.Pattern]] = None # alias → compiled regex
 _cache_lock = threading.Lock()
 
+# ── O9: Process-level skill embedding matrix ──────────────────────────────────
+# Row i of _skill_matrix_cache is the unit-norm embedding of _skill_ids_cache[i].
+_skill_ids_cache: Optional[np.ndarray] = None     # (n_skills,) int64
+_skill_matrix_cache: Optional[np.ndarray] = None  # (n_skills, d) float32 | float16 | int8
+_skill_scales_cache: Optional[np.ndarray] = None  # (n_skills, 1) float32 — int8 only (O12)
+_skill_matrix_oversized = False  # O14: catalog too large → pgvector HNSW instead
+
 
-@lru_cache(maxsize=1)
 def _get_embedding_model():
-    from sentence_transformers import SentenceTransformer
-    return SentenceTransformer(settings.embedding_model)
+    return get_embedding_model()
 
 
 # ---------------------------------------------------------------------------
@@ -84,13 +118,13 @@ def extract_skills(
             score = min(raw_conf * weight, 1.0)
             _update_best(candidates, skill_id, score, "alias_match")
 
-    # --- Pass 2: embedding ANN — batch all chunks in one pgvector round-trip ---
+    # --- Pass 2: embedding similarity — all chunks × all skills in one GEMM ---
     model = _get_embedding_model()
 
     # Collect (section_name, chunk_text) pairs across all sections
     all_section_chunks: list[tuple[str, str]] = []
     for section_name, section_text in sections.items():
-        for chunk in _make_chunks(section_text, _CHUNK_SIZE, _CHUNK_OVERLAP):
+        for chunk in _make_sentence_chunks(section_text, _CHUNK_MAX_TOKENS, model.tokenizer):
             all_section_chunks.append((section_name, chunk))
 
     if all_section_chunks:
@@ -99,8 +133,18 @@ def extract_skills(
         all_embeddings = model.encode(
             chunk_texts, normalize_embeddings=True, show_progress_bar=False
         )
-        # O2: one SQL round-trip for all embeddings
-        batch_results = _pgvector_search_batch(list(all_embeddings), db, top_k=_TOP_K)
+        if _prime_skill_matrix(db):
+            # O9: one in-process matmul for all embeddings
+            batch_results = _matrix_search_batch(
+                all_embeddings,
+                _skill_ids_cache,  # type: ignore[arg-type]
+                _skill_matrix_cache,  # type: ignore[arg-type]
+                top_k=_TOP_K,
+                skill_scales=_skill_scales_cache,
+            )
+        else:
+            # O14: large catalog — one round-trip, HNSW-indexed ANN per chunk
+            batch_results = _pgvector_search_batch(list(all_embeddings), db, top_k=_TOP_K)
 
         for (section_name, _), ann_hits in zip(all_section_chunks, batch_results):
             weight = get_section_weight(section_name)
@@ -153,13 +197,60 @@ def _prime_caches(db: Session) -> None:
         log.info("alias_cache_primed", alias_count=len(alias_map))
 
 
+def _prime_skill_matrix(db: Session) -> bool:
+    """
+    Load the skill embedding matrix on first call; no-op thereafter (O9).
+    Returns False when the catalog exceeds SKILL_MATRIX_MAX_SKILLS and the
+    caller should search pgvector instead (O14).
+    """
+    global _skill_ids_cache, _skill_matrix_cache, _skill_scales_cache, _skill_matrix_oversized
+    if _skill_matrix_cache is not None or _skill_matrix_oversized:
+        return not _skill_matrix_oversized
+    with _cache_lock:
+        if _skill_matrix_cache is not None or _skill_matrix_oversized:
+            return not _skill_matrix_oversized
+        skill_count = db.execute(
+            text("SELECT count(*) FROM skills WHERE is_active = true AND embedding IS NOT NULL")
+        ).scalar_one()
+        if skill_count > settings.skill_matrix_max_skills:
+            _skill_matrix_oversized = True
+            log.info(
+                "skill_matrix_skipped",
+                skill_count=skill_count,
+                max_skills=settings.skill_matrix_max_skills,
+            )
+            return False
+        skill_ids, matrix = _build_skill_matrix(db)
+        scales = None
+        if settings.skill_matrix_precision == "int8":
+            matrix, scales = _quantize_rows_int8(matrix)
+        elif settings.skill_matrix_precision == "float16":
+            matrix = matrix.astype(np.float16)
+        _skill_ids_cache = skill_ids
+        _skill_scales_cache = scales
+        _skill_matrix_cache = matrix
+        log.info(
+            "skill_matrix_primed",
+            skill_count=len(skill_ids),
+            dim=matrix.shape[1],
+            dtype=str(matrix.dtype),
+            nbytes=matrix.nbytes,
+        )
+        return True
+
+
 def invalidate_alias_cache() -> None:
     """Force rebuild on next extract_skills() call. Call after re-seeding skills."""
     global _alias_map_cache, _sorted_aliases_cache, _pattern_cache
+    global _skill_ids_cache, _skill_matrix_cache, _skill_scales_cache, _skill_matrix_oversized
     with _cache_lock:
         _alias_map_cache = None
         _sorted_aliases_cache = None
         _pattern_cache = None
+        _skill_ids_cache = None
+        _skill_matrix_cache = None
+        _skill_scales_cache = None
+        _skill_matrix_oversized = False
 
 
 # ---------------------------------------------------------------------------
@@ -229,6 +320,190 @@ def _alias_scan(text: str, alias_map: dict[str, int]) -> list[tuple[int, float]]
     return list(found.items())
 
 
+# ---------------------------------------------------------------------------
+# O9: In-process matrix search
+# ---------------------------------------------------------------------------
+
+def _build_skill_matrix(db: Session) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (skill_ids, matrix) for all active skills with an embedding.
+    matrix is a contiguous (n_skills, d) float32 array with unit-norm rows.
+
+    The whole matrix comes back as ONE bytea value: vector_send() is pgvector's
+    binary wire format (4-byte header + big-endian float4s), so the header is
+    stripped per row and the rows are concatenated server-side. np.frombuffer
+    then views it without parsing a text vector per skill.
+    """
+    row = db.execute(
+        text(
+            """
+            SELECT array_agg(skill_id ORDER BY skill_id) AS skill_ids,
+                   string_agg(substring(vector_send(embedding) FROM 5), ''::bytea
+                              ORDER BY skill_id) AS blob
+            FROM   skills
+            WHERE  is_active = true AND embedding IS NOT NULL
+            """
+        )
+    ).one()
+    if not row.skill_ids:
+        return (
+            np.empty(0, dtype=np.int64),
+            np.empty((0, settings.embedding_dimension), dtype=np.float32),
+        )
+    skill_ids = np.asarray(row.skill_ids, dtype=np.int64)
+    matrix = (
+        np.frombuffer(row.blob, dtype=">f4")
+        .reshape(len(skill_ids), -1)
+        .astype(np.float32)  # native byte order, writable copy
+    )
+    return skill_ids, _l2_normalize_rows(matrix)
+
+
+def _l2_normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit L2 norm. All-zero rows are left as zeros."""
+    # Row-wise self dot product (vectorised vdot) — skips np.linalg.norm's
+    # dispatch and its intermediate abs/square arrays.
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))[:, None]
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _quantize_rows_int8(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-row int8 quantisation (O12).
+    Returns (q, scales) with matrix ≈ q * scales; scales has shape (n_rows, 1).
+    """
+    scales = np.abs(matrix).max(axis=1, keepdims=True) / 127.0
+    scales[scales == 0] = 1.0
+    q = np.round(matrix / scales).astype(np.int8)
+    return q, scales.astype(np.float32)
+
+
+def _matrix_search_batch(
+    embeddings: np.ndarray,
+    skill_ids: np.ndarray,
+    skill_matrix: np.ndarray,
+    top_k: int = 5,
+    skill_scales: Optional[np.ndarray] = None,
+) -> list[list[tuple[int, float]]]:
+    """
+    Top-k skills for every chunk embedding via one (n_chunks × n_skills) matmul.
+
+    skill_matrix is unit-norm float32 or float16 rows, or int8 rows from
+    _quantize_rows_int8() with their skill_scales (O12).
+
+    Drop-in replacement for _pgvector_search_batch: returns a list of length
+    len(embeddings), each element a list of (skill_id, similarity) tuples
+    sorted by similarity descending.
+    """
+    n_chunks = len(embeddings)
+    if n_chunks == 0 or skill_matrix.shape[0] == 0:
+        return [[] for _ in range(n_chunks)]
+
+    chunks = _l2_normalize_rows(np.asarray(embeddings, dtype=np.float32))
+    if skill_matrix.dtype == np.float32:
+        return _semantic_search(chunks, skill_ids, skill_matrix, top_k)
+
+    if skill_matrix.dtype == np.float16:
+        sims = _float16_dot(chunks, skill_matrix)
+    else:
+        chunks_q, chunk_scales = _quantize_rows_int8(chunks)
+        sims = _int8_dot(chunks_q, skill_matrix).astype(np.float32)
+        sims *= chunk_scales * skill_scales.T  # type: ignore[union-attr]
+
+    top_idx = _top_k_indices(sims, top_k)
+    top_sims = np.take_along_axis(sims, top_idx, axis=1)
+    top_ids = skill_ids[top_idx]
+    return [
+        list(zip(ids.tolist(), scores.tolist()))
+        for ids, scores in zip(top_ids, top_sims)
+    ]
+
+
+def _float16_dot(chunks: np.ndarray, skill_matrix: np.ndarray) -> np.ndarray:
+    """
+    float32 (n_chunks, n_skills) dot products against a float16 matrix (O12).
+    The GEMM runs in half precision via torch on a transposed view of the
+    cached matrix; only the score array is widened, never the matrix. Torch
+    builds without a CPU half matmul widen the matrix to float32 in
+    _SCORE_BLOCK_ROWS slices instead.
+    """
+    import torch
+
+    try:
+        chunks_half = torch.from_numpy(chunks.astype(np.float16))
+        return (chunks_half @ torch.from_numpy(skill_matrix).T).float().numpy()
+    except RuntimeError:
+        pass
+    chunks = chunks.astype(np.float32, copy=False)
+    out = np.empty((len(chunks), len(skill_matrix)), dtype=np.float32)
+    for start in range(0, len(skill_matrix), _SCORE_BLOCK_ROWS):
+        block = skill_matrix[start:start + _SCORE_BLOCK_ROWS].astype(np.float32)
+        np.matmul(chunks, block.T, out=out[:, start:start + _SCORE_BLOCK_ROWS])
+    return out
+
+
+def _int8_dot(chunks_q: np.ndarray, skill_matrix: np.ndarray) -> np.ndarray:
+    """
+    int32 (n_chunks, n_skills) dot products of two int8 matrices (O12).
+
+    torch._int_mm is a real int8 GEMM with int32 accumulation, and reads the
+    cached matrix through a transposed view — nothing matrix-sized is
+    allocated. Torch builds without a CPU _int_mm widen the matrix to int32
+    in _SCORE_BLOCK_ROWS slices, so the transient copy stays bounded.
+    """
+    import torch
+
+    try:
+        return torch._int_mm(torch.from_numpy(chunks_q), torch.from_numpy(skill_matrix).T).numpy()
+    except (AttributeError, RuntimeError):
+        pass
+    chunks_wide = chunks_q.astype(np.int32)
+    out = np.empty((len(chunks_q), len(skill_matrix)), dtype=np.int32)
+    for start in range(0, len(skill_matrix), _SCORE_BLOCK_ROWS):
+        block = skill_matrix[start:start + _SCORE_BLOCK_ROWS].astype(np.int32)
+        np.matmul(chunks_wide, block.T, out=out[:, start:start + _SCORE_BLOCK_ROWS])
+    return out
+
+
+def _top_k_indices(sims: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Column indices of the top_k values in each row, sorted descending.
+    argpartition selects in O(n_skills) per row; only the k winners are sorted.
+    """
+    k = min(top_k, sims.shape[1])
+    if k == sims.shape[1]:
+        return np.argsort(-sims, axis=1)
+    part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(sims, part, axis=1), axis=1)
+    return np.take_along_axis(part, order, axis=1)
+
+
+def _semantic_search(
+    chunks: np.ndarray,
+    skill_ids: np.ndarray,
+    skill_matrix: np.ndarray,
+    top_k: int,
+) -> list[list[tuple[int, float]]]:
+    """
+    float32 path of _matrix_search_batch — both sides already unit-norm.
+    torch.from_numpy shares memory, so this always runs on CPU.
+    """
+    import torch
+    from sentence_transformers import util
+
+    hits = util.semantic_search(
+        torch.from_numpy(chunks),
+        torch.from_numpy(skill_matrix),
+        top_k=top_k,
+        score_function=util.dot_score,
+    )
+    return [
+        [(int(skill_ids[h["corpus_id"]]), float(h["score"])) for h in chunk_hits]
+        for chunk_hits in hits
+    ]
+
+
 # ---------------------------------------------------------------------------
 # O2: Batched pgvector search
 # ---------------------------------------------------------------------------
@@ -291,7 +566,7 @@ def _pgvector_search(
 ) -> list[tuple[int, float]]:
     """
     Single-embedding pgvector search. Kept for evaluate_parser.py and tests.
-    The hot path (extract_skills) uses _pgvector_search_batch instead.
+    extract_skills uses _pgvector_search_batch for oversized catalogs (O14).
     """
     vec_str = "[" + ",".join(f"{v:.6f}" for v in embedding.tolist()) + "]"
     rows = db.execute(
@@ -313,6 +588,47 @@ def _pgvector_search(
 # Text chunking
 # ---------------------------------------------------------------------------
 
+def _make_sentence_chunks(text: str, max_tokens: int, tokenizer=None) -> list[str]:
+    """
+    Pack consecutive sentences / lines into chunks of at most max_tokens (O11).
+
+    tokenizer is the embedding model's (fast) HF tokenizer; all sentences of
+    the text are tokenized in one batched call. Without one, tokens are
+    whitespace-separated words. A single sentence longer than max_tokens is
+    cut at token offsets into windows of max_tokens tokens, with no overlap.
+    """
+    units = [" ".join(unit.split()) for unit in _SENTENCE_SPLIT_RE.split(text)]
+    units = [unit for unit in units if unit]
+    if not units:
+        return []
+    if tokenizer is None:
+        spans = [[m.span() for m in re.finditer(r"\S+", unit)] for unit in units]
+    else:
+        spans = tokenizer(units, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for unit, unit_spans in zip(units, spans):
+        n_tokens = len(unit_spans)
+        if n_tokens > max_tokens:
+            if current:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            for start in range(0, n_tokens, max_tokens):
+                window = unit_spans[start:start + max_tokens]
+                chunks.append(unit[window[0][0]:window[-1][1]])
+            continue
+        if current and current_tokens + n_tokens > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(unit)
+        current_tokens += n_tokens
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
 def _make_chunks(text: str, chunk_size: int, overlap: int) -> list[str]:
     words = text.split()
     if not words:
@@ -21,6 +21,8 @@ import uuid
 from typing import Any
 
 import structlog
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from src.database import get_db
 from src.models.jd import JDAnalysis
@@ -101,13 +103,7 @@ def analyze_jd_task(
             db.query(UserSkill).filter(
                 UserSkill.session_id == uuid.UUID(session_id)
             ).delete()
-            for s in resume_skills:
-                db.add(UserSkill(
-                    session_id=uuid.UUID(session_id),
-                    skill_id=s["skill_id"],
-                    confidence=s["confidence"],
-                    source=s["source"],
-                ))
+            _bulk_insert_user_skills(db, session_id, resume_skills)
             db.flush()
 
             _update_task(session_id, status="processing", pct=55, msg="Matching against job description…")
@@ -128,23 +124,29 @@ def analyze_jd_task(
             expanded_names = expand_jd_concepts(jd_text)
             if expanded_names:
                 existing_ids = {s["skill_id"] for s in jd_profile}
+                # One round-trip for all implied names (served by the
+                # lower(display_name) index) instead of one query per name.
+                rows = db.execute(
+                    _sql(
+                        "SELECT DISTINCT ON (LOWER(display_name)) "
+                        "       LOWER(display_name) AS name_lower, skill_id "
+                        "FROM skills "
+                        "WHERE LOWER(display_name) = ANY(:names) AND is_active = true "
+                        "ORDER BY LOWER(display_name), skill_id"
+                    ),
+                    {"names": [n.lower() for n in expanded_names]},
+                ).all()
+                skill_id_by_name = {r.name_lower: r.skill_id for r in rows}
                 for skill_name in expanded_names:
-                    row = db.execute(
-                        _sql(
-                            "SELECT skill_id FROM skills "
-                            "WHERE LOWER(display_name) = LOWER(:name) AND is_active = true "
-                            "LIMIT 1"
-                        ),
-                        {"name": skill_name},
-                    ).first()
-                    if row and row.skill_id not in existing_ids:
+                    skill_id = skill_id_by_name.get(skill_name.lower())
+                    if skill_id is not None and skill_id not in existing_ids:
                         jd_profile.append({
-                            "skill_id": row.skill_id,
+                            "skill_id": skill_id,
                             "importance_score": 0.4,
                             "display_name": skill_name,
                             "category": "Other",
                         })
-                        existing_ids.add(row.skill_id)
+                        existing_ids.add(skill_id)
 
             # Persist JD skills into jd_analyses record
             jd_record = db.query(JDAnalysis).filter(
@@ -286,6 +288,24 @@ def _update_task(
             task.completed_at = datetime.datetime.utcnow()
 
 
+def _bulk_insert_user_skills(db: Session, session_id: str, skill_results: list[dict]) -> None:
+    if not skill_results:
+        return
+    sid = uuid.UUID(session_id)
+    db.execute(
+        insert(UserSkill),
+        [
+            {
+                "session_id": sid,
+                "skill_id": s["skill_id"],
+                "confidence": s["confidence"],
+                "source": s["source"],
+            }
+            for s in skill_results
+        ],
+    )
+
+
 def _fail(session_id: str, error_msg: str) -> dict:
     with get_db() as db:
         task = db.query(Task).filter(
@@ -20,6 +20,11 @@ Performance optimisations applied:
   O6 — DB transaction split into two short-lived phases. The 4–15 s Groq LLM
        call (step 8) runs outside any DB context, so no idle connection is held
        during inference.
+  O10 — user_skills persisted with one multi-row INSERT instead of one ORM
+        add() per extracted skill.
+  O13 — steps 2 and 4 are cached in Redis by SHA-256 of the file bytes plus
+        scoring config and catalog fingerprint (services/resume_cache.py);
+        re-uploads of the same file skip parsing and embedding entirely.
 
 On any unhandled exception:
   - Update task status → "failed" with error message.
@@ -31,6 +36,8 @@ import uuid
 from typing import Any
 
 import structlog
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from src.database import get_db
 from src.models.resume import Resume
@@ -39,6 +46,11 @@ from src.models.session import UserSession
 from src.models.task import Task
 from src.models.user_skill import UserSkill
 from src.services.gap_analyzer import analyze_gap
+from src.services.resume_cache import (
+    analysis_cache_key,
+    get_cached_analysis,
+    set_cached_analysis,
+)
 from src.services.resume_parser import ParseError, parse_resume
 from src.services.roadmap_generator import generate_roadmap
 from src.services.role_normalizer import RoleMatch, normalize_role
@@ -76,10 +88,17 @@ def analyze_resume_task(
 
         # ── Phase 1: fast DB work (no LLM, all I/O is local or low-latency) ──
         with get_db() as db:
-            try:
-                parsed = parse_resume(file_bytes, filename)
-            except ParseError as exc:
-                return _fail(session_id, str(exc))
+            # O13: identical bytes → reuse the previous parse + skill extraction
+            cache_key = analysis_cache_key(file_bytes, db)
+            cached = get_cached_analysis(cache_key)
+            if cached is not None:
+                parsed = cached["parsed"]
+                log.info("resume_cache_hit", session_id=session_id)
+            else:
+                try:
+                    parsed = parse_resume(file_bytes, filename)
+                except ParseError as exc:
+                    return _fail(session_id, str(exc))
 
             # Persist parsed resume
             resume = db.query(Resume).filter(Resume.session_id == uuid.UUID(session_id)).first()
@@ -148,19 +167,17 @@ def analyze_resume_task(
             # ── O4: 40 % — skill extraction started ──────────────────────────
             _update_task(session_id, status="processing", pct=40, msg="Extracting skills…")
 
-            skill_results = extract_skills(parsed["sections"], parsed["raw_text"], db)
+            if cached is not None:
+                skill_results = cached["skills"]
+            else:
+                skill_results = extract_skills(parsed["sections"], parsed["raw_text"], db)
+                set_cached_analysis(cache_key, parsed, skill_results)
 
             # Persist user_skills (upsert: delete old, insert new)
             db.query(UserSkill).filter(
                 UserSkill.session_id == uuid.UUID(session_id)
             ).delete()
-            for s in skill_results:
-                db.add(UserSkill(
-                    session_id=uuid.UUID(session_id),
-                    skill_id=s["skill_id"],
-                    confidence=s["confidence"],
-                    source=s["source"],
-                ))
+            _bulk_insert_user_skills(db, session_id, skill_results)
             db.flush()
 
             # ── O4: 65 % — gap analysis starting ──────────────────────────────
@@ -298,6 +315,25 @@ def _update_task(
             task.completed_at = datetime.datetime.utcnow()
 
 
+def _bulk_insert_user_skills(db: Session, session_id: str, skill_results: list[dict]) -> None:
+    """O10: persist all extracted skills in one executemany round-trip."""
+    if not skill_results:
+        return
+    sid = uuid.UUID(session_id)
+    db.execute(
+        insert(UserSkill),
+        [
+            {
+                "session_id": sid,
+                "skill_id": s["skill_id"],
+                "confidence": s["confidence"],
+                "source": s["source"],
+            }
+            for s in skill_results
+        ],
+    )
+
+
 def _fail(session_id: str, error_msg: str) -> dict:
     with get_db() as db:
         task = db.query(Task).filter(
@@ -8,6 +8,11 @@ Wipes parsed_text and replaces sections JSONB with only the pre-computed metadat
 Raw file bytes are never stored on disk — they exist only in-memory during parsing
 and in the Celery task message (ephemeral Redis). Only parsed_text and sections
 are persisted to the DB and are subject to this wipe.
+
+The resume cache (src/services/resume_cache.py) keeps a second copy of the parsed
+text and sections in Redis under resume_cache:v2:*. It is not touched by this task;
+it expires on its own after RESUME_CACHE_TTL_SECONDS (default 900 s, the same
+window as this wipe), and RESUME_CACHE_TTL_SECONDS=0 disables it.
 """
 
 import uuid
@@ -8,7 +8,7 @@ import sys
 
 import structlog
 from celery import Celery
-from celery.signals import worker_ready
+from celery.signals import worker_init, worker_ready
 
 from src.config import get_settings
 
@@ -63,14 +63,52 @@ if sys.platform == "win32":
     celery_app.conf.worker_pool = "solo"
 
 
+# ── O16: Load the embedding model in the prefork parent ───────────────────────
+# worker_init fires in the main process *before* the pool forks, so every child
+# (including replacements after worker_max_tasks_per_child) inherits the loaded
+# weights copy-on-write instead of reading ~90 MB from disk on its first task.
+# CPU only: a CUDA context (or even a CUDA availability probe) in the parent
+# makes every forked child fail on first use, so GPU hosts — and "auto" hosts
+# that have an NVIDIA driver installed — skip the preload and load per child as
+# before. No encode() runs here.
+
+@worker_init.connect
+def _preload_models(sender=None, **kwargs):
+    if not settings.preload_embedding_model:
+        return
+    try:
+        from src.services.embedding_model import fork_safe_device, get_embedding_model
+        device = fork_safe_device()
+        if device != "cpu":
+            log.info(
+                "worker_model_preload_skipped",
+                device=device or settings.embedding_device,
+                reason="preload is CPU-only; set EMBEDDING_DEVICE=cpu to force it",
+            )
+            return
+        get_embedding_model()
+        log.info("worker_model_preloaded")
+    except Exception as exc:
+        # Non-fatal: children load the model on first use instead
+        log.warning("worker_model_preload_failed", error=str(exc))
+
+
 # ── O8: Pre-warm embedding model on worker startup ────────────────────────────
 # Loading sentence-transformers the first time takes 2–10 s on Render's free
 # tier. Running it at worker_ready moves that cost to startup (before any
 # request), eliminating cold-start latency on the first task.
+# Skipped under prefork: worker_ready fires in the parent after the children
+# have forked, so a load there never reaches the processes that run tasks (and
+# on GPU hosts would probe CUDA in the parent). The solo pool runs tasks in
+# this process, so it still warms up here.
 
 @worker_ready.connect
 def _warm_up_models(sender, **kwargs):
     """Load embedding models into memory immediately after the worker starts."""
+    from celery.concurrency.prefork import TaskPool as PreforkPool
+
+    if isinstance(getattr(sender, "pool", None), PreforkPool):
+        return
     try:
         log.info("worker_model_warmup_start")
         from src.services.skill_extractor import _get_embedding_model as _se_model
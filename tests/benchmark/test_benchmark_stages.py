@@ -134,9 +134,13 @@ def embedding_model():
 
 @pytest.fixture(scope="session")
 def resume_chunks(embedding_model):
-    from src.services.skill_extractor import _make_chunks
-    text = " ".join(_resume_sections().values())
-    return _make_chunks(text, chunk_size=80, overlap=20)
+    # Chunk per section exactly as extract_skills() does (O11)
+    from src.services.skill_extractor import _CHUNK_MAX_TOKENS, _make_sentence_chunks
+    return [
+        chunk
+        for section_text in _resume_sections().values()
+        for chunk in _make_sentence_chunks(section_text, _CHUNK_MAX_TOKENS, embedding_model.tokenizer)
+    ]
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,58 @@
+"""Tests for embedding_model device resolution — no model download."""
+
+import pytest
+import torch
+
+from src.services import embedding_model
+from src.services.embedding_model import _backend_model_kwargs, fork_safe_device
+
+
+class TestForkSafeDevice:
+    @pytest.mark.parametrize("configured", ["cpu", "cuda", "mps"])
+    def test_explicit_device_is_returned(self, monkeypatch, configured):
+        monkeypatch.setattr(embedding_model.settings, "embedding_device", configured)
+        assert fork_safe_device() == configured
+
+    def test_auto_with_cuda_build_and_driver_is_undecided(self, monkeypatch):
+        monkeypatch.setattr(embedding_model.settings, "embedding_device", "auto")
+        monkeypatch.setattr(torch.backends.cuda, "is_built", lambda: True)
+        monkeypatch.setattr(embedding_model.ctypes, "CDLL", lambda name: object())
+        monkeypatch.setattr(
+            torch.cuda, "is_available", lambda: pytest.fail("must not probe CUDA")
+        )
+        assert fork_safe_device() is None
+
+    def test_auto_with_cuda_build_and_no_driver_is_cpu(self, monkeypatch):
+        def _missing(name):
+            raise OSError(name)
+
+        monkeypatch.setattr(embedding_model.settings, "embedding_device", "auto")
+        monkeypatch.setattr(torch.backends.cuda, "is_built", lambda: True)
+        monkeypatch.setattr(embedding_model.ctypes, "CDLL", _missing)
+        monkeypatch.setattr(
+            torch.cuda, "is_available", lambda: pytest.fail("must not probe CUDA")
+        )
+        assert fork_safe_device() == "cpu"
+
+    def test_auto_without_cuda_build_is_cpu(self, monkeypatch):
+        monkeypatch.setattr(embedding_model.settings, "embedding_device", "auto")
+        monkeypatch.setattr(torch.backends.cuda, "is_built", lambda: False)
+        assert fork_safe_device() == "cpu"
+
+
+class TestBackendModelKwargs:
+    def test_torch_gets_no_file_name(self, monkeypatch):
+        monkeypatch.setattr(embedding_model.settings, "embedding_model_file", "onnx/model_O3.onnx")
+        assert _backend_model_kwargs("torch", "cpu") is None
+
+    def test_openvino_gets_file_name_and_threads(self, monkeypatch):
+        monkeypatch.setattr(embedding_model.settings, "embedding_model_file", "openvino/model.xml")
+        monkeypatch.setattr(embedding_model.settings, "embedding_num_threads", 3)
+        assert _backend_model_kwargs("openvino", "cpu") == {
+            "file_name": "openvino/model.xml",
+            "ov_config": {"INFERENCE_NUM_THREADS": "3"},
+        }
+
+    def test_no_thread_limit_off_cpu(self, monkeypatch):
+        monkeypatch.setattr(embedding_model.settings, "embedding_model_file", "")
+        assert _backend_model_kwargs("openvino", "cuda") == {}
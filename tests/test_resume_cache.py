@@ -0,0 +1,73 @@
+"""Tests for resume_cache helpers — no Redis required."""
+
+import hashlib
+
+from src.services import resume_cache
+from src.services.resume_cache import content_digest
+
+
+class _FakeRow:
+    n = 512
+    max_id = 530
+
+
+class _FakeDb:
+    def execute(self, *args, **kwargs):
+        class _Result:
+            def one(self):
+                return _FakeRow()
+
+        return _Result()
+
+
+class TestResumeCache:
+    def test_digest_is_sha256_of_bytes(self):
+        data = b"%PDF-1.4 fake resume"
+        assert content_digest(data) == hashlib.sha256(data).hexdigest()
+
+    def test_key_includes_scoring_config(self):
+        key = resume_cache._cache_key("abc", "512.530")
+        settings = resume_cache.settings
+        assert key.endswith(":512.530:abc")
+        assert settings.embedding_model in key
+        assert settings.embedding_backend in key
+        assert settings.skill_matrix_precision in key
+        assert str(settings.skill_extraction_threshold) in key
+
+    def test_key_changes_with_config_and_catalog(self, monkeypatch):
+        base = resume_cache._cache_key("abc", "512.530")
+        assert resume_cache._cache_key("abc", "0.0") != base
+        monkeypatch.setattr(resume_cache.settings, "skill_matrix_precision", "int8")
+        assert resume_cache._cache_key("abc", "512.530") != base
+        monkeypatch.setattr(resume_cache.settings, "embedding_model_file", "onnx/model_qint8_avx2.onnx")
+        assert "onnx/model_qint8_avx2.onnx" in resume_cache._cache_key("abc", "512.530")
+
+    def test_analysis_key_uses_catalog_fingerprint(self, monkeypatch):
+        monkeypatch.setattr(resume_cache, "_get_redis", lambda: object())
+        key = resume_cache.analysis_cache_key(b"resume", _FakeDb())
+        assert key == resume_cache._cache_key(content_digest(b"resume"), "512.530")
+
+    def test_disabled_cache_skips_key_and_lookup(self, monkeypatch):
+        monkeypatch.setattr(resume_cache, "_get_redis", lambda: None)
+        assert resume_cache.analysis_cache_key(b"resume", None) is None
+        assert resume_cache.get_cached_analysis(None) is None
+
+    def test_redis_errors_degrade_to_miss(self, monkeypatch):
+        class _BrokenRedis:
+            def get(self, key):
+                raise ConnectionError("down")
+
+            def setex(self, key, ttl, value):
+                raise ConnectionError("down")
+
+        monkeypatch.setattr(resume_cache, "_get_redis", lambda: _BrokenRedis())
+        assert resume_cache.get_cached_analysis("abc") is None
+        resume_cache.set_cached_analysis("abc", {"raw_text": ""}, [])  # must not raise
+
+    def test_corrupt_entry_is_a_miss(self, monkeypatch):
+        class _CorruptRedis:
+            def get(self, key):
+                return b'{"parsed": {"raw_te'
+
+        monkeypatch.setattr(resume_cache, "_get_redis", lambda: _CorruptRedis())
+        assert resume_cache.get_cached_analysis("abc") is None
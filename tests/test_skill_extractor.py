@@ -1,7 +1,17 @@
 """Tests for skill_extractor helper functions — no DB, no embeddings."""
 
+import numpy as np
 import pytest
-from src.services.skill_extractor import _make_chunks, _alias_scan
+from src.services.skill_extractor import (
+    _alias_scan,
+    _float16_dot,
+    _int8_dot,
+    _make_chunks,
+    _make_sentence_chunks,
+    _matrix_search_batch,
+    _quantize_rows_int8,
+    _top_k_indices,
+)
 
 
 class TestMakeChunks:
@@ -31,6 +41,48 @@ class TestMakeChunks:
             assert len(chunk.split()) <= 30
 
 
+class TestMakeSentenceChunks:
+    def test_short_text_single_chunk(self):
+        text = "Python developer. Built APIs with FastAPI."
+        assert _make_sentence_chunks(text, max_tokens=100) == [text]
+
+    def test_empty_text_returns_empty(self):
+        assert _make_sentence_chunks("", 100) == []
+        assert _make_sentence_chunks("  \n\n ", 100) == []
+
+    def test_splits_on_sentence_boundaries(self):
+        text = "one two three. four five six.\nseven eight"
+        chunks = _make_sentence_chunks(text, max_tokens=6)
+        assert chunks == ["one two three. four five six.", "seven eight"]
+
+    def test_no_overlap_between_chunks(self):
+        text = "\n".join(f"line{i} a b c" for i in range(30))
+        chunks = _make_sentence_chunks(text, max_tokens=10)
+        words = " ".join(chunks).split()
+        assert len(words) == 30 * 4
+        for chunk in chunks:
+            assert len(chunk.split()) <= 10
+
+    def test_oversized_sentence_is_split(self):
+        text = " ".join(f"w{i}" for i in range(25))
+        chunks = _make_sentence_chunks(text, max_tokens=10)
+        assert [len(c.split()) for c in chunks] == [10, 10, 5]
+
+    def test_tokenizer_offsets_drive_packing_and_splitting(self):
+        calls = []
+
+        def char_tokenizer(units, add_special_tokens, return_offsets_mapping):
+            # One token per non-space character — far finer than words.
+            calls.append(list(units))
+            spans = [[(i, i + 1) for i, c in enumerate(u) if c != " "] for u in units]
+            return {"offset_mapping": spans}
+
+        text = "ab cd. efghijk"
+        chunks = _make_sentence_chunks(text, max_tokens=4, tokenizer=char_tokenizer)
+        assert calls == [["ab cd.", "efghijk"]]  # one batched call
+        assert chunks == ["ab cd", ".", "efgh", "ijk"]
+
+
 class TestAliasScan:
     def test_finds_exact_alias(self):
         alias_map = {"python": 1, "javascript": 2, "react": 3}
@@ -61,3 +113,134 @@ class TestAliasScan:
     def test_empty_text_returns_empty(self):
         alias_map = {"python": 1}
         assert _alias_scan("", alias_map) == []
+
+
+class TestMatrixSearchBatch:
+    def _catalog(self):
+        skill_ids = np.array([10, 20, 30], dtype=np.int64)
+        matrix = np.eye(3, 4, dtype=np.float32)  # unit-norm rows
+        return skill_ids, matrix
+
+    def test_returns_one_result_list_per_chunk(self):
+        skill_ids, matrix = self._catalog()
+        chunks = np.array([[1, 0, 0, 0], [0, 1, 0, 0]], dtype=np.float32)
+        results = _matrix_search_batch(chunks, skill_ids, matrix, top_k=2)
+        assert len(results) == 2
+        assert all(len(r) == 2 for r in results)
+
+    def test_best_match_first_with_cosine_score(self):
+        skill_ids, matrix = self._catalog()
+        chunks = np.array([[0, 3, 4, 0]], dtype=np.float32)  # not unit-norm
+        results = _matrix_search_batch(chunks, skill_ids, matrix, top_k=3)
+        assert [sid for sid, _ in results[0]] == [30, 20, 10]
+        assert results[0][0][1] == pytest.approx(0.8)
+        assert results[0][1][1] == pytest.approx(0.6)
+
+    def test_top_k_capped_at_catalog_size(self):
+        skill_ids, matrix = self._catalog()
+        chunks = np.array([[1, 1, 1, 1]], dtype=np.float32)
+        results = _matrix_search_batch(chunks, skill_ids, matrix, top_k=10)
+        assert len(results[0]) == 3
+
+    def test_empty_catalog_returns_empty_lists(self):
+        chunks = np.array([[1, 0, 0, 0]], dtype=np.float32)
+        results = _matrix_search_batch(
+            chunks, np.empty(0, dtype=np.int64), np.empty((0, 4), dtype=np.float32)
+        )
+        assert results == [[]]
+
+    def test_int8_matrix_matches_float32_ranking(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.standard_normal((50, 16)).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        skill_ids = np.arange(50, dtype=np.int64)
+        chunks = rng.standard_normal((4, 16)).astype(np.float32)
+
+        exact = _matrix_search_batch(chunks, skill_ids, matrix, top_k=3)
+        q, scales = _quantize_rows_int8(matrix)
+        approx = _matrix_search_batch(chunks, skill_ids, q, top_k=3, skill_scales=scales)
+
+        for e, a in zip(exact, approx):
+            assert a[0][0] == e[0][0]
+            for (_, es), (_, as_) in zip(e, a):
+                assert as_ == pytest.approx(es, abs=0.02)
+
+    def test_float16_matrix_matches_float32(self):
+        rng = np.random.default_rng(2)
+        matrix = rng.standard_normal((30, 16)).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        skill_ids = np.arange(30, dtype=np.int64)
+        chunks = rng.standard_normal((3, 16)).astype(np.float32)
+
+        exact = _matrix_search_batch(chunks, skill_ids, matrix, top_k=3)
+        half = _matrix_search_batch(chunks, skill_ids, matrix.astype(np.float16), top_k=3)
+
+        for e, h in zip(exact, half):
+            assert h[0][0] == e[0][0]
+            assert h[0][1] == pytest.approx(e[0][1], abs=1e-3)
+
+
+class TestQuantizeRowsInt8:
+    def test_round_trip_error_is_small(self):
+        matrix = np.array([[0.5, -0.25, 0.1], [0.0, 0.0, 0.0]], dtype=np.float32)
+        q, scales = _quantize_rows_int8(matrix)
+        assert q.dtype == np.int8
+        assert scales.shape == (2, 1)
+        assert np.abs(q * scales - matrix).max() < 0.5 / 127
+        assert q[0].max() == 127
+
+
+class TestInt8Dot:
+    def test_blocked_fallback_matches_int_mm(self, monkeypatch):
+        import torch
+
+        from src.services import skill_extractor
+
+        rng = np.random.default_rng(3)
+        skills = rng.integers(-127, 128, (50, 16), dtype=np.int8)
+        chunks = rng.integers(-127, 128, (4, 16), dtype=np.int8)
+        expected = chunks.astype(np.int32) @ skills.astype(np.int32).T
+
+        np.testing.assert_array_equal(_int8_dot(chunks, skills), expected)
+
+        def _no_int_mm(*args, **kwargs):
+            raise RuntimeError("no CPU kernel")
+
+        monkeypatch.setattr(torch, "_int_mm", _no_int_mm)
+        monkeypatch.setattr(skill_extractor, "_SCORE_BLOCK_ROWS", 16)
+        np.testing.assert_array_equal(_int8_dot(chunks, skills), expected)
+
+
+class TestFloat16Dot:
+    def test_blocked_fallback_matches_half_matmul(self, monkeypatch):
+        import torch
+
+        from src.services import skill_extractor
+
+        rng = np.random.default_rng(4)
+        skills = rng.standard_normal((50, 16)).astype(np.float16)
+        chunks = rng.standard_normal((4, 16)).astype(np.float32)
+        expected = chunks @ skills.astype(np.float32).T
+
+        np.testing.assert_allclose(_float16_dot(chunks, skills), expected, atol=2e-2)
+
+        def _no_half_kernel(*args, **kwargs):
+            raise RuntimeError("no CPU kernel")
+
+        monkeypatch.setattr(torch, "from_numpy", _no_half_kernel)
+        monkeypatch.setattr(skill_extractor, "_SCORE_BLOCK_ROWS", 16)
+        fallback = _float16_dot(chunks, skills)
+        assert fallback.dtype == np.float32
+        np.testing.assert_allclose(fallback, expected, rtol=1e-6, atol=1e-6)
+
+
+class TestTopKIndices:
+    def test_matches_full_sort(self):
+        rng = np.random.default_rng(1)
+        sims = rng.standard_normal((6, 40)).astype(np.float32)
+        expected = np.argsort(-sims, axis=1)[:, :5]
+        np.testing.assert_array_equal(_top_k_indices(sims, 5), expected)
+
+    def test_k_larger_than_columns(self):
+        sims = np.array([[0.1, 0.9, 0.5]], dtype=np.float32)
+        np.testing.assert_array_equal(_top_k_indices(sims, 10), [[1, 2, 0]])